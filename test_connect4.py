@@ -0,0 +1,99 @@
+# Unit tests for the bitboard move logic and the minimax search in connect4.py.
+# Run with: pytest
+
+import math
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed
+pytest.importorskip("pygame")
+
+import connect4
+from connect4 import BOARD_WIDTH, PLAYER1, PLAYER2, WIN_SCORE
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """A fresh game; run from a temporary directory since __init__ creates c4_metrics."""
+    monkeypatch.chdir(tmp_path)
+    game = connect4.Connect4Game()
+    yield game
+    game.executor.shutdown()
+
+
+def random_positions(game, count, seed):
+    """Yield (moves, player to move) for random positions with no win on the board yet."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        game.reset_game()
+        moves = []
+        player = PLAYER1
+        for _ in range(rng.randint(0, 30)):
+            valid_cols = [col for col in range(BOARD_WIDTH) if game.is_valid_move(col)]
+            col = rng.choice(valid_cols)
+            game.drop_piece(col, player)
+            if game.check_win(player):
+                game.undo_move(col, player)
+                break
+            moves.append((col, player))
+            player = PLAYER2 if player == PLAYER1 else PLAYER1
+        yield moves, player
+
+
+def reference_minimax(game, depth, maximizing_player):
+    """Plain minimax over every column, with the same scoring as Connect4Game.minimax."""
+    if game.is_board_full():
+        return 0
+    if depth == 0:
+        return game.evaluate_board()
+    player = PLAYER2 if maximizing_player else PLAYER1
+    scores = []
+    for col in range(BOARD_WIDTH):
+        if game.is_valid_move(col):
+            game.drop_piece(col, player)
+            if game.check_win(player):
+                score = WIN_SCORE + depth - 1 if maximizing_player else -WIN_SCORE - depth + 1
+            else:
+                score = reference_minimax(game, depth - 1, not maximizing_player)
+            game.undo_move(col, player)
+            scores.append(score)
+    return max(scores) if maximizing_player else min(scores)
+
+
+def test_winning_moves_matches_drop_and_check_win(game):
+    for _ in random_positions(game, 300, seed=1):
+        for player in (PLAYER1, PLAYER2):
+            expected = 0
+            for col in range(BOARD_WIDTH):
+                if game.is_valid_move(col):
+                    bit = 1 << (col * connect4.BITS_PER_COL + game.heights[col])
+                    game.drop_piece(col, player)
+                    if game.check_win(player):
+                        expected |= bit
+                    game.undo_move(col, player)
+            assert game.winning_moves(player) == expected
+
+
+def test_mirror_tt_key_matches_mirrored_position(game):
+    for moves, _ in random_positions(game, 300, seed=3):
+        key = game.bitboards[PLAYER1] | (game.bitboards[PLAYER2] << connect4.TT_KEY_SHIFT)
+        game.reset_game()
+        for col, player in moves:
+            game.drop_piece(BOARD_WIDTH - 1 - col, player)
+        mirrored_key = game.bitboards[PLAYER1] | (game.bitboards[PLAYER2] << connect4.TT_KEY_SHIFT)
+        assert connect4.mirror_tt_key(key) == mirrored_key
+        assert connect4.mirror_tt_key(mirrored_key) == key
+        # The null-move marker stays in place
+        null_key = key | connect4.TT_NULL_MOVE_KEY
+        assert connect4.mirror_tt_key(null_key) == mirrored_key | connect4.TT_NULL_MOVE_KEY
+
+
+def test_minimax_matches_reference(game):
+    for moves, player in random_positions(game, 40, seed=2):
+        maximizing = player == PLAYER2
+        score, col = game.minimax(4, -math.inf, math.inf, maximizing)
+        assert score == reference_minimax(game, 4, maximizing)
+        assert col is None if game.is_board_full() else game.is_valid_move(col)
+        assert game.move_count == len(moves)  # Search left the position unchanged